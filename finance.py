@@ -6,34 +6,230 @@ It includes functions to load, add, save, and view transactions, as well as
 filter transactions by category or summarize them by month.
 """
 
-import re # Regex Module
+import csv # CSV Module
+import sys # System Module
+from array import array # Typed Array Module
+from bisect import bisect_left, bisect_right # Sorted Search Module
 from datetime import date, datetime # Date and Time Module
-from typing import List, Dict, Any # Type Annotation Module
-
-# List to store all transactions
-transactions: List[Dict[str, Any]] = []
+from functools import lru_cache # Caching Module
+from typing import Dict, Iterable, List, Optional, Tuple # Type Annotation Module
+
+# Names of the transaction types, indexed by their stored code
+TRANSACTION_TYPES: Tuple[str, str] = ("income", "outcome")
+INCOME: int = 0
+OUTCOME: int = 1
+
+# Codes given to each category on first use, and the category names by code
+CATEGORY_CODES: Dict[str, int] = {}
+CATEGORY_NAMES: List[str] = []
+
+# Columns storing all transactions, sorted by date.
+# The transaction at a given row is made of the values at that row in each column.
+types: array = array("b") # Type codes (INCOME / OUTCOME)
+amounts: array = array("d") # Amounts
+category_codes: array = array("I") # Category codes
+dates: List[date] = [] # Dates
+date_strs: List[str] = [] # Dates formatted as 'dd-mm-yyyy', cached for display
+
+# Sorted rows of the transactions of each category, by category code,
+# and whether it must be rebuilt before it is used again
+CATEGORY_INDEX: Dict[int, List[int]] = {}
+_category_index_stale: bool = False
+
+# Running totals of the transactions amounts, as [income, outcome] lists
+# indexed by the type code: overall, by (year, month) and by category code
+TOTALS: List[float] = [0.0, 0.0]
+MONTHLY_TOTALS: Dict[Tuple[int, int], List[float]] = {}
+CATEGORY_TOTALS: Dict[int, List[float]] = {}
 
 # File path for storing transactions
 FILE_PATH: str = "transactions.csv"
 
 
-def load_transactions() -> None:
+@lru_cache(maxsize=None)
+def _parse_date(dt_str: str) -> date:
     """
-    Load transactions from a CSV file into the transactions list.
+    Parse a date string in 'dd-mm-yyyy' format.
+
+    The fixed format is sliced directly instead of going through strptime.
+    Results are cached, since the same dates tend to repeat across many
+    transactions.
+
+    Args:
+        dt_str (str): Date in 'dd-mm-yyyy' format.
+
+    Returns:
+        date: The parsed date.
+
+    Raises:
+        ValueError: If the date format is invalid.
     """
-    # Opening the csv file in reading mode
-    with open(FILE_PATH, "r", encoding="UTF-8") as file:
-        # Iterating over each row in the file
-        for row in file:
-            row = row.strip()
+    # Validating the layout of the date string
+    if len(dt_str) != 10 or dt_str[2] != "-" or dt_str[5] != "-":
+        raise ValueError("Date must be in dd-mm-yyyy format.")
+
+    day, month, year = dt_str[0:2], dt_str[3:5], dt_str[6:10]
+    digits: str = day + month + year
+
+    # Only ASCII digits are accepted, as strptime does
+    if not (digits.isascii() and digits.isdigit()):
+        raise ValueError("Date must be in dd-mm-yyyy format.")
+
+    # Building the date, which also validates the day and month values
+    return date(int(year), int(month), int(day))
+
+
+def _category_code(category: str) -> int:
+    """
+    Get the code of a category, giving it a new code if it was never used.
+
+    Args:
+        category (str): Name of the category.
+
+    Returns:
+        int: The code of the category.
+    """
+    code: Optional[int] = CATEGORY_CODES.get(category)
+
+    if code is None:
+        code = CATEGORY_CODES[category] = len(CATEGORY_NAMES)
+        CATEGORY_NAMES.append(category)
+
+    return code
+
 
+def load_transactions() -> None:
+    """
+    Load transactions from a CSV file into the transactions columns.
+    """
+    # Opening the csv file in reading mode, leaving the newlines to the csv reader
+    with open(FILE_PATH, "r", encoding="UTF-8", newline="") as file:
+        # Iterating over each row in the file, split into fields by the csv reader
+        # (skipping the spaces older versions of the file have before the date)
+        for row in csv.reader(file, skipinitialspace=True):
             # If there is data in the row, set it in the matching variables
-            # and add the transaction to the list
-            if row:
-                trans_type, amount, category, dt_str = [
-                    element.strip() for element in row.split(",")
-                ]
-                add_transaction(trans_type, amount, category, dt_str)
+            # and add the transaction to the columns.
+            # The rows were validated before they were saved, so they are only
+            # converted, without validating them again.
+            if any(field.strip() for field in row):
+                trans_type, amount, category, dt_str = row
+                dt_str = dt_str.strip()
+
+                _add_transaction_fast(
+                    TRANSACTION_TYPES.index(trans_type.strip()),
+                    float(amount),
+                    _category_code(category.strip()),
+                    _parse_date(dt_str),
+                    dt_str
+                )
+
+    # Sorting all the loaded transactions by date once, instead of on every row
+    _sort_transactions()
+
+
+def _sort_transactions() -> None:
+    """
+    Reorder all the transactions columns so the transactions are sorted by date.
+    """
+    # Getting the rows in date order (the sort is stable, so equal dates keep
+    # their original order)
+    order: List[int] = sorted(range(len(dates)), key=dates.__getitem__)
+
+    types[:] = array("b", map(types.__getitem__, order))
+    amounts[:] = array("d", map(amounts.__getitem__, order))
+    category_codes[:] = array("I", map(category_codes.__getitem__, order))
+    dates[:] = map(dates.__getitem__, order)
+    date_strs[:] = map(date_strs.__getitem__, order)
+
+    # Rebuilding the category index for the new order of the rows
+    _rebuild_category_index()
+
+
+def _rebuild_category_index() -> None:
+    """
+    Rebuild the category index from the category codes column.
+    """
+    global _category_index_stale
+
+    CATEGORY_INDEX.clear()
+
+    for row, category_code in enumerate(category_codes):
+        CATEGORY_INDEX.setdefault(category_code, []).append(row)
+
+    _category_index_stale = False
+
+
+def _index_transaction(category_code: int, row: int) -> None:
+    """
+    Add a new transaction row to the category index.
+
+    Must be called before the transaction is inserted into the columns.
+
+    Appending a row costs O(1). Inserting a row before the end moves every
+    later row down, so instead of renumbering them on every insert the index
+    is marked stale, and rebuilt in O(N) the next time it is used.
+
+    Args:
+        category_code (int): Category code of the new transaction.
+        row (int): Row the new transaction is inserted at.
+    """
+    global _category_index_stale
+
+    if row < len(dates):
+        _category_index_stale = True
+    elif not _category_index_stale:
+        # The appended row is the last one, so the category rows stay sorted
+        CATEGORY_INDEX.setdefault(category_code, []).append(row)
+
+
+def _add_to_totals(type_code: int, amount: float, category_code: int, dt: date) -> None:
+    """
+    Add the amount of a new transaction to the running totals.
+
+    Args:
+        type_code (int): Type code of the transaction.
+        amount (float): Amount of the transaction.
+        category_code (int): Category code of the transaction.
+        dt (date): Date of the transaction.
+    """
+    TOTALS[type_code] += amount
+    MONTHLY_TOTALS.setdefault((dt.year, dt.month), [0.0, 0.0])[type_code] += amount
+    CATEGORY_TOTALS.setdefault(category_code, [0.0, 0.0])[type_code] += amount
+
+
+def _add_transaction_fast(
+    type_code: int,
+    amount: float,
+    category_code: int,
+    dt: date,
+    dt_str: str,
+    row: Optional[int] = None
+) -> None:
+    """
+    Add an already validated transaction to the transactions columns.
+
+    Args:
+        type_code (int): Type code of the transaction.
+        amount (float): Amount of the transaction.
+        category_code (int): Category code of the transaction.
+        dt (date): Date of the transaction.
+        dt_str (str): Date of the transaction in 'dd-mm-yyyy' format.
+        row (Optional[int]): Row to insert the transaction at. If None, the
+            transaction is appended without keeping the columns sorted, and
+            the caller is responsible for sorting afterwards.
+    """
+    if row is None:
+        row = len(dates)
+
+    _index_transaction(category_code, row)
+    _add_to_totals(type_code, amount, category_code, dt)
+
+    # Adding the transaction details to each of the columns
+    types.insert(row, type_code)
+    amounts.insert(row, amount)
+    category_codes.insert(row, category_code)
+    dates.insert(row, dt)
+    date_strs.insert(row, dt_str)
 
 
 def add_transaction(
@@ -43,7 +239,7 @@ def add_transaction(
     dt_str: str
 ) -> None:
     """
-    Add a new transaction to the transactions list.
+    Validate a new transaction and add it to the transactions columns.
 
     Args:
         trans_type (str): Type of transaction ('income' or 'outcome').
@@ -77,37 +273,66 @@ def add_transaction(
 
     # Validating transaction date input
     try:
-        dt: date = datetime.strptime(dt_str, "%d-%m-%Y").date()
+        dt: date = _parse_date(dt_str)
 
         if dt > datetime.now().date():
             raise ValueError("Date cant be in the future.")
     except ValueError as err:
         raise ValueError("Invalid date input. Enter: (Day-Month-Year).") from err
 
-    # Adding the transaction details to the list in the form of a dictionary
-    transactions.append({
-		"type": trans_type,
-		"amount": amount,
-		"category": category,
-		"date": dt
-	})
-
-    # Sorting transactions by date in descending order (most recent date at the end)
-    transactions.sort(key=lambda trans: trans["date"])
+    # Adding the transaction at its row, keeping the columns sorted by date
+    # (most recent date at the end)
+    _add_transaction_fast(
+        TRANSACTION_TYPES.index(trans_type),
+        amount,
+        _category_code(category),
+        dt,
+        f"{dt:%d-%m-%Y}",
+        bisect_right(dates, dt)
+    )
 
 
 def save_transactions() -> None:
     """
     Save all transactions to a CSV file.
     """
+    # Opening the csv file in writing mode and writing all the transactions
+    # columns as rows at once, letting the csv writer quote fields when needed
+    with open(FILE_PATH, "w", encoding="UTF-8", newline="") as file:
+        csv.writer(file, lineterminator="\n").writerows(zip(
+            map(TRANSACTION_TYPES.__getitem__, types),
+            amounts,
+            map(CATEGORY_NAMES.__getitem__, category_codes),
+            date_strs
+        ))
+
+
+def _format_rows(rows: Iterable[int]) -> List[str]:
+    """
+    Format the given transactions rows as lines of a summary table.
+
+    Args:
+        rows (Iterable[int]): Rows of the transactions to format.
+
+    Returns:
+        List[str]: A table line for each of the transactions.
+    """
+    return [
+        f"{TRANSACTION_TYPES[types[row]].capitalize():<10} {amounts[row]:<15.2f} "
+        f"{CATEGORY_NAMES[category_codes[row]]:<20} "
+        f"{date_strs[row]:<15}"
+        for row in rows
+    ]
+
+
+def _write_lines(lines: List[str]) -> None:
+    """
+    Write the given lines to the standard output in a single write.
 
-    # Opening the csv file in writing mode
-    with open(FILE_PATH, "w", encoding="UTF-8") as file:
-        # Iterating over each transaction in the transactions list
-        # and adding the it as a row to the csv file
-        for trans in transactions:
-            file.write(f"{trans["type"]},{trans["amount"]},{trans["category"]},\
-                {trans["date"].strftime("%d-%m-%Y").strip()}\n")
+    Args:
+        lines (List[str]): Lines to write, without line endings.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def view_summary() -> None:
@@ -115,35 +340,25 @@ def view_summary() -> None:
     Display a summary of all transactions, including total income, outcome, 
     and balance.
     """
-    # Get the total amount of all incomes
-    total_income: float = sum(
-		trans["amount"] for trans in transactions
-		if trans["type"] == "income"
-	)
-
-    # Get the total amount of all outcomes
-    total_outcome: float = sum(
-		trans["amount"] for trans in transactions
-		if trans["type"] == "outcome"
-	)
+    # Get the total amounts of all incomes and all outcomes
+    total_income: float = TOTALS[INCOME]
+    total_outcome: float = TOTALS[OUTCOME]
 
     # Getting the difference as the current balance
     total_balance: float = total_income - total_outcome
 
     # Printing all transactions
-    if transactions:
-        print("\n--- Overall Summary ---")
-        print(f"{'Type':<10} {'Amount':<15} {'Category':<20} {'Date':<15}")
-        print("-" * 60)
-
-        for trans in transactions:
-            print(f"{trans['type'].capitalize():<10} {trans['amount']:<15.2f} "
-                  f"{trans['category']:<20} {trans['date'].strftime('%d-%m-%Y'):<15}")
-
-        print("-" * 60)
-        print(f"{'Total Income':<20}: {total_income:>15.2f}")
-        print(f"{'Total Outcome':<20}: {total_outcome:>15.2f}")
-        print(f"{'Total Balance':<20}: {total_balance:>15.2f}")
+    if dates:
+        _write_lines([
+            "\n--- Overall Summary ---",
+            f"{'Type':<10} {'Amount':<15} {'Category':<20} {'Date':<15}",
+            "-" * 60,
+            *_format_rows(range(len(dates))),
+            "-" * 60,
+            f"{'Total Income':<20}: {total_income:>15.2f}",
+            f"{'Total Outcome':<20}: {total_outcome:>15.2f}",
+            f"{'Total Balance':<20}: {total_balance:>15.2f}"
+        ])
     else:
         print("No transactions found.")
 
@@ -155,53 +370,41 @@ def view_monthly_summary() -> None:
     Prompts the user to enter the month and year, and filters transactions 
     accordingly.
     """
-    # Get user input
-    month: str = input("Enter month: ").strip()
-    year: str = input("Enter Year: ").strip()
-    # A regex pattern to look for a certain month and year.
-    reg: str = rf"^\d{{2}}-{month.zfill(2)}-{year.zfill(4)}$"
-
-    # Validate the input and converting the them to integers
+    # Get user input, converting it straight to integers and validating it
     try:
-        month = int(month)
-        year = int(year)
+        month: int = int(input("Enter month: "))
+        year: int = int(input("Enter Year: "))
 
-        if month > 12 or month < 1 or year > datetime.now().year:
+        if not 1 <= month <= 12 or year > datetime.now().year:
             raise ValueError
+
+        # The first day of the month, and the first day of the following month
+        month_start: date = date(year, month, 1)
+        month_end: date = date(year + month // 12, month % 12 + 1, 1)
     except ValueError as err:
         raise ValueError("Invalid date values.\nEnter a valid month and year.") from err
 
-    # Creating a new list with only the transactions matching the regex
-    monthly_transactions: List[Dict[str, Any]] = [
-        trans for trans in transactions
-        if re.match(reg, trans["date"].strftime("%d-%m-%Y")) is not None
-    ]
-
-    # Get the total amount of matching incomes
-    month_income: float = sum(
-		trans["amount"] for trans in monthly_transactions
-		if trans["type"] == "income"
-	)
+    # Since the dates are sorted, the transactions of the month are the
+    # consecutive rows between the start of the month and the start of the next one
+    monthly_rows: range = range(
+        bisect_left(dates, month_start),
+        bisect_left(dates, month_end)
+    )
 
-    # Get the total amount of matching outcomes
-    month_outcome: float = sum(
-		trans["amount"] for trans in monthly_transactions
-		if trans["type"] == "outcome"
-	)
+    # Get the total amounts of matching incomes and outcomes
+    month_income, month_outcome = MONTHLY_TOTALS.get((year, month), (0.0, 0.0))
 
     # Printing all the matching transactions and the totals
-    if monthly_transactions:
-        print(f"\n--- Summary for {month:02d}-{year} ---")
-        print(f"{'Type':<10} {'Amount':<15} {'Category':<20} {'Date':<15}")
-        print("-" * 60)
-
-        for trans in monthly_transactions:
-            print(f"{trans['type'].capitalize():<10} {trans['amount']:<15.2f} "
-                  f"{trans['category']:<20} {trans['date'].strftime('%d-%m-%Y'):<15}")
-
-        print("-" * 60)
-        print(f"{'Total Monthly Income':<25}: {month_income:>15.2f}")
-        print(f"{'Total Monthly Outcome':<25}: {month_outcome:>15.2f}")
+    if monthly_rows:
+        _write_lines([
+            f"\n--- Summary for {month:02d}-{year} ---",
+            f"{'Type':<10} {'Amount':<15} {'Category':<20} {'Date':<15}",
+            "-" * 60,
+            *_format_rows(monthly_rows),
+            "-" * 60,
+            f"{'Total Monthly Income':<25}: {month_income:>15.2f}",
+            f"{'Total Monthly Outcome':<25}: {month_outcome:>15.2f}"
+        ])
     else:
         print("No transactions found for this month.")
 
@@ -215,37 +418,33 @@ def filter_by_category() -> None:
     # Getting input
     category: str = input("Enter category: ").lower().strip()
 
-    # Creating a new list with only the transactions matching the category input
-    category_transactions: List[Dict[str, Any]] = [
-        trans for trans in transactions
-        if trans['category'] == category
-    ]
+    # Get the code of the category, a category without a code has no transactions
+    code: Optional[int] = CATEGORY_CODES.get(category)
+
+    # Getting the rows of the transactions matching the category code from the index,
+    # rebuilding it first if transactions were inserted before the end since
+    if _category_index_stale:
+        _rebuild_category_index()
 
-    # Get the total amount of matching incomes
-    category_income: float = sum(
-		trans["amount"] for trans in category_transactions
-		if trans["type"] == "income"
-	)
+    category_rows: List[int] = CATEGORY_INDEX.get(code, [])
 
-    # Get the total amount of matching outcomes
-    category_outcome: float = sum(
-		trans["amount"] for trans in category_transactions
-		if trans["type"] == "outcome"
-	)
+    # Get the total amounts of matching incomes and outcomes
+    category_income, category_outcome = CATEGORY_TOTALS.get(code, (0.0, 0.0))
 
     # Printing all the matching transactions and the totals
-    if category_transactions:
-        print(f"\n--- Summary for Category: {category.capitalize()} ---")
-        print(f"{'Type':<10} {'Amount':<15} {'Date':<15}")
-        print("-" * 40)
-
-        for trans in category_transactions:
-            print(f"{trans['type'].capitalize():<10} {trans['amount']:<15.2f} "
-                  f"{trans['date'].strftime('%d-%m-%Y'):<15}")
-            category = category.title()
-
-            print("-" * 40)
-            print(f"{'Total Income' :<20}: {category_income:>15.2f}")
-            print(f"{'Total Outcome':<20}: {category_outcome:>15.2f}")
+    if category_rows:
+        _write_lines([
+            f"\n--- Summary for Category: {category.capitalize()} ---",
+            f"{'Type':<10} {'Amount':<15} {'Date':<15}",
+            "-" * 40,
+            *(
+                f"{TRANSACTION_TYPES[types[row]].capitalize():<10} {amounts[row]:<15.2f} "
+                f"{date_strs[row]:<15}"
+                for row in category_rows
+            ),
+            "-" * 40,
+            f"{'Total Income' :<20}: {category_income:>15.2f}",
+            f"{'Total Outcome':<20}: {category_outcome:>15.2f}"
+        ])
     else:
         print("No transactions found for this category.")